@@ -1,95 +1,426 @@
 #!/usr/bin/env python3
 import os
+import io
 import sys
 import argparse
 import json
 import shutil
-from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor
-import ollama
+import sqlite3
+import hashlib
+import heapq
+import threading
+import time
+import urllib.parse
+import urllib.request
+from typing import Dict, List, Any, FrozenSet, Iterator, NamedTuple, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
+try:
+    import ijson  # Optional: parses streamed plans incrementally.
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: faster JSON serialization and parsing.
+except ImportError:
+    orjson = None
+
+# JSON schemas passed as Ollama's `format` so decoding is constrained to a valid plan.
+PLAN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "organization_plan": {
+            "type": "object",
+            "additionalProperties": {"type": "array", "items": {"type": "string"}},
+        },
+    },
+    "required": ["organization_plan"],
+}
+GROUPED_PLAN_SCHEMA = {
+    "type": "object",
+    "properties": {"plans": {"type": "array", "items": PLAN_SCHEMA}},
+    "required": ["plans"],
+}
+
+# Errors raised when a streamed plan is not valid JSON.
+PLAN_STREAM_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serializes an object to compact JSON, using orjson when it is installed.
+    Both paths produce the same output: no whitespace and unescaped non-ASCII text,
+    which keeps prompts short in tokens. File names that are not valid UTF-8 reach
+    Python as lone surrogates; text containing them is written with ASCII escapes.
+    Args:
+        obj (Any): The object to serialize.
+    Returns:
+        str: The JSON text.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, separators=(',', ':'))
+    text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+    try:
+        text.encode('utf-8')
+    except UnicodeEncodeError:
+        return json.dumps(obj, separators=(',', ':'))
+    return text
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parses JSON text, using orjson when it is installed.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter either way.
+    Args:
+        data (Union[str, bytes]): The JSON text, or its UTF-8 encoding.
+    Returns:
+        Any: The parsed object.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the escaped lone surrogates json_dumps writes for file
+            # names that are not valid UTF-8; the stdlib parser accepts them.
+            if (b'\\ud' if isinstance(data, bytes) else '\\ud') not in data:
+                raise
+    return json.loads(data)
+
+
+def fast_move(src: str, dst: str):
+    """
+    Moves a file or folder with a single rename when possible. shutil.move is only used
+    for what a rename cannot do, such as crossing filesystems (EXDEV) or moving into an
+    existing directory.
+    Args:
+        src (str): The path to move.
+        dst (str): The destination path.
+    """
+    try:
+        os.replace(src, dst)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.move(src, dst)
+
+
+class _ChunkReader(io.RawIOBase):
+    """
+    A read-only binary file object over an iterator of text chunks, as consumed by ijson.
+    """
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+        self._pending = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk.encode('utf-8')
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def echo_chunks(chunks: Iterator[str], interval: float = 1 / 30) -> Iterator[str]:
+    """
+    Prints streamed chunks to the terminal as they pass through. Chunks arrive a few
+    tokens at a time, so they are coalesced into at most one write per interval.
+    Args:
+        chunks (Iterator[str]): The streamed content chunks.
+        interval (float): The minimum number of seconds between terminal writes.
+    Yields:
+        str: The same chunks, unchanged.
+    """
+    pending = []
+    last_emit = time.monotonic()
+    for chunk in chunks:
+        pending.append(chunk)
+        now = time.monotonic()
+        if now - last_emit >= interval:
+            print("".join(pending), end='', flush=True)
+            pending.clear()
+            last_emit = now
+        yield chunk
+    print("".join(pending))
+    print()
+
+
+def salvage_json(text: str) -> Any:
+    """
+    Parses JSON that may have been cut off, e.g. by a truncated model response.
+    The text is cut back to the last complete value whose enclosing brackets can be
+    closed into a valid document, so only fully received strings are kept.
+    Args:
+        text (str): The possibly truncated JSON text.
+    Returns:
+        Any: The parsed object.
+    Raises:
+        json.JSONDecodeError: If no complete prefix can be recovered.
+    """
+    try:
+        return json_loads(text)
+    except json.JSONDecodeError as e:
+        error = e
+
+    closers = {'{': '}', '[': ']'}
+    stack, cut_points = [], []
+    in_string = escaped = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+                cut_points.append((i + 1, ''.join(closers[c] for c in reversed(stack))))
+        elif char == '"':
+            in_string = True
+        elif char in closers:
+            stack.append(char)
+            cut_points.append((i + 1, ''.join(closers[c] for c in reversed(stack))))
+        elif char in '}]' and stack:
+            stack.pop()
+            cut_points.append((i + 1, ''.join(closers[c] for c in reversed(stack))))
+
+    # The latest cut points usually parse; a cut right after an object key does not.
+    for end, closing in reversed(cut_points[-64:]):
+        try:
+            return json_loads(text[:end] + closing)
+        except json.JSONDecodeError:
+            continue
+    raise error
+
+
+def iter_plan_items(chunks: Iterator[str]) -> Iterator[Tuple[str, Any]]:
+    """
+    Yields the (category, items) pairs of a streamed 'organization_plan' as each one completes,
+    so the response does not have to be parsed as a whole. Without ijson the stream is joined
+    and parsed once at the end, salvaging what it can from a truncated response.
+    Args:
+        chunks (Iterator[str]): The streamed content chunks of the JSON response.
+    Yields:
+        Tuple[str, Any]: A category name and its items.
+    Raises:
+        One of PLAN_STREAM_ERRORS if the response is not valid JSON.
+    """
+    chunks = iter(chunks)
+    if ijson is None:
+        yield from salvage_json("".join(chunks)).get("organization_plan", {}).items()
+        return
+    received, done = [], set()
+    def record():
+        for chunk in chunks:
+            received.append(chunk)
+            yield chunk
+    try:
+        for category, items in ijson.kvitems(_ChunkReader(record()), 'organization_plan'):
+            done.add(category)
+            yield category, items
+        return
+    except UnicodeDecodeError:
+        # ijson's C backend cannot decode the escaped lone surrogates json_dumps writes for
+        # file names that are not valid UTF-8; let the stdlib parser finish the response.
+        pass
+    for category, items in salvage_json("".join(received) + "".join(chunks)).get("organization_plan", {}).items():
+        if category not in done:
+            yield category, items
+
+
+def resolve_ollama_host(host: str = None) -> str:
+    """
+    Resolves the Ollama server URL from OLLAMA_HOST the way the ollama CLI does,
+    defaulting to http on port 11434.
+    Args:
+        host (str): An explicit host; OLLAMA_HOST is used when omitted.
+    Returns:
+        str: The base URL of the server.
+    """
+    host = (host or os.environ.get('OLLAMA_HOST') or '').strip() or '127.0.0.1:11434'
+    if '://' not in host:
+        host = 'http://' + host
+    parts = urllib.parse.urlsplit(host)
+    default_port = 443 if parts.scheme == 'https' else 11434
+    netloc = parts.netloc if parts.port else f"{parts.hostname or '127.0.0.1'}:{default_port}"
+    return f"{parts.scheme}://{netloc}{parts.path.rstrip('/')}"
+
+
+def env_positive_int(name: str, default: int) -> int:
+    """
+    Reads a positive integer from an environment variable.
+    Args:
+        name (str): The variable's name.
+        default (int): The value used when the variable is unset, empty or not a positive integer.
+    Returns:
+        int: The parsed value, or the default.
+    """
+    try:
+        value = int(os.environ.get(name, ''))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
 class OllamaClient:
     """
     A client for interacting with the Ollama API.
     This class handles the communication with the Ollama model, including error handling.
     """
-    def __init__(self, model: str):
+    CONNECTION_CHECK_TTL = 30
+    CONNECTION_TIMEOUT = 2.0
+    # Busy or briefly failing servers get a few retries, waiting 1s, 2s, then 4s.
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 1.0
+
+    def __init__(self, model: str, keep_alive=None):
         """
         Initializes the OllamaClient.
         Args:
             model (str): The name of the Ollama model to use.
+            keep_alive (str | int): How long the server keeps the model loaded after a request.
         """
+        # Imported here so runs that never talk to the model (--help, --undo) skip loading it.
+        import ollama
+
         self.model = model
+        self.keep_alive = keep_alive
+        self.host = resolve_ollama_host()
+        # One client per instance keeps a pooled HTTP connection open across all requests.
+        self._client = ollama.Client(host=self.host)
+        self._response_error = ollama.ResponseError
+        self._last_ok_ts = None
 
     def check_connection(self):
         """
         Checks if the Ollama service is reachable.
+        A successful check is remembered for CONNECTION_CHECK_TTL seconds.
         Returns:
             bool: True if the service is running, False otherwise.
         """
+        if self._last_ok_ts is not None and time.monotonic() - self._last_ok_ts < self.CONNECTION_CHECK_TTL:
+            return True
         try:
-            ollama.list()
+            # /api/version is a tiny response, unlike the full model list.
+            with urllib.request.urlopen(f"{self.host}/api/version", timeout=self.CONNECTION_TIMEOUT) as response:
+                response.read()
+            self._last_ok_ts = time.monotonic()
             return True
         except Exception as e:
-            print(f"\n❌ Error: Could not connect to Ollama. Is the application running?\n   (Details: {e})")
+            if isinstance(getattr(e, 'reason', e), TimeoutError):
+                print(f"\n❌ Error: Ollama at {self.host} did not respond within {self.CONNECTION_TIMEOUT} seconds. Is it overloaded?")
+            else:
+                print(f"\n❌ Error: Could not connect to Ollama at {self.host}. Is the application running?\n   (Details: {e})")
             return False
 
-    def get_file_batch_plan_sync(self, prompt: str, batch_num: int) -> dict:
+    def warm_up(self):
+        """
+        Loads the model on the server ahead of the first real request, so that request
+        does not pay the cold-load latency. Failures are ignored; real requests report them.
+        """
+        try:
+            self._client.chat(model=self.model, messages=[], keep_alive=self.keep_alive)
+        except Exception:
+            pass
+
+    def _chat(self, **kwargs):
+        """
+        Sends a non-streaming chat request, retrying with exponential backoff when the
+        server reports that it is overloaded or hit a transient error.
+        Returns:
+            ChatResponse: The model's response.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                return self._client.chat(**kwargs)
+            except self._response_error as e:
+                if attempt == self.MAX_RETRIES or e.status_code not in self.RETRY_STATUS_CODES:
+                    raise
+                time.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+
+    @staticmethod
+    def _messages(prompt: str, system: str = None) -> List[Dict[str, str]]:
+        """
+        Builds the chat messages for a prompt. Static instructions go in a separate system
+        message ahead of the data, so every request shares an identical prefix that the
+        server can reuse from its prompt cache.
+        """
+        if system is None:
+            return [{'role': 'user', 'content': prompt}]
+        return [{'role': 'system', 'content': system}, {'role': 'user', 'content': prompt}]
+
+    def get_file_batch_plan_sync(self, prompt: str, batch_num: int, schema: dict = PLAN_SCHEMA, system: str = None) -> str:
         """
         Synchronously gets an organization plan for a file batch from the Ollama model.
         Args:
             prompt (str): The prompt to send to the model.
             batch_num (int): The batch number for logging purposes.
+            schema (dict): The JSON schema the response must follow.
+            system (str): The instructions sent as the system message, if any.
         Returns:
-            dict: The raw JSON response from the model.
+            str: The JSON content of the model's response, or None if the request failed.
         """
         try:
-            response = ollama.chat(
+            response = self._chat(
                 model=self.model,
-                messages=[{'role': 'user', 'content': prompt}],
+                messages=self._messages(prompt, system),
                 options={'temperature': 0.0},
-                format='json'
+                keep_alive=self.keep_alive,
+                format=schema
             )
-            return response
+            return response['message']['content']
         except Exception as e:
             print(f"\n❌ Error in AI batch {batch_num}: {e}")
-            return {}
+            return None
 
-    def get_plan_sync(self, prompt: str) -> dict:
+    def get_plan_sync(self, prompt: str, system: str = None) -> dict:
         """
         Synchronously gets an organization plan from the Ollama model.
         Args:
             prompt (str): The prompt to send to the model.
+            system (str): The instructions sent as the system message, if any.
         Returns:
             dict: The JSON response from the model.
         """
         try:
-            response = ollama.chat(
+            response = self._chat(
                 model=self.model,
-                messages=[{'role': 'user', 'content': prompt}],
+                messages=self._messages(prompt, system),
                 options={'temperature': 0.0},
-                format='json'
+                keep_alive=self.keep_alive,
+                format=PLAN_SCHEMA
             )
-            return json.loads(response['message']['content'])
+            return json_loads(response['message']['content'])
         except Exception as e:
             print(f"\n❌ An AI communication error occurred: {e}")
             return None
 
-    def get_plan_stream(self, prompt: str):
+    def get_plan_stream(self, prompt: str, system: str = None):
         """
         Gets an organization plan from the Ollama model, streaming the response.
         Args:
             prompt (str): The prompt to send to the model.
+            system (str): The instructions sent as the system message, if any.
         Yields:
             str: The content chunks of the JSON response.
         """
         try:
-            response_stream = ollama.chat(
+            response_stream = self._client.chat(
                 model=self.model,
-                messages=[{'role': 'user', 'content': prompt}],
+                messages=self._messages(prompt, system),
                 options={'temperature': 0.0},
-                format='json',
+                keep_alive=self.keep_alive,
+                format=PLAN_SCHEMA,
                 stream=True
             )
             for chunk in response_stream:
@@ -98,131 +429,791 @@ class OllamaClient:
             print(f"\n❌ An AI communication error occurred during streaming: {e}")
 
 
+class PlanCache:
+    """
+    A persistent cache of AI responses, keyed by a hash of the model and prompt,
+    so re-running on an unchanged directory skips the model entirely.
+    """
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".broom", "plan_cache.sqlite")
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        """
+        Opens the cache, creating it if needed.
+        Args:
+            path (str): The SQLite database file backing the cache.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS plans (key TEXT PRIMARY KEY, content TEXT NOT NULL)")
+
+    @staticmethod
+    def key(model: str, prompt: str) -> str:
+        """
+        Computes the cache key for a prompt sent to a model.
+        Returns:
+            str: A hex BLAKE2b digest.
+        """
+        return hashlib.blake2b(f"{model}\0{prompt}".encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str):
+        """
+        Looks up a cached response.
+        Returns:
+            str: The cached JSON content, or None on a miss.
+        """
+        row = self._conn.execute("SELECT content FROM plans WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, content: str):
+        """
+        Stores a response.
+        Args:
+            key (str): The cache key.
+            content (str): The JSON content of the AI response.
+        """
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO plans (key, content) VALUES (?, ?)", (key, content))
+
+
+class SampleCache:
+    """
+    A snapshot of the file content samples of one directory, stored inside it and keyed
+    by relative path. Entries are validated against the file's modification time and
+    size, so unchanged files are not re-read.
+    """
+    FILENAME = ".broom_index.sqlite"
+
+    def __init__(self, directory: str):
+        """
+        Opens the directory's snapshot, creating it if needed.
+        Args:
+            directory (str): The directory being organized.
+        """
+        self._conn = sqlite3.connect(os.path.join(directory, self.FILENAME))
+        self._conn.execute("CREATE TABLE IF NOT EXISTS samples (path BLOB PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+                           "size INTEGER NOT NULL, length INTEGER NOT NULL, content TEXT NOT NULL)")
+
+    @staticmethod
+    def _key(path: str) -> bytes:
+        """
+        Encodes a relative path for storage. Paths are stored as bytes because file names
+        that are not valid UTF-8 cannot be bound to SQLite as text.
+        """
+        return path.encode('utf-8', errors='surrogateescape')
+
+    def get(self, path: str, mtime_ns: int, size: int, length: int):
+        """
+        Looks up the sample of a file.
+        Args:
+            path (str): The file's path, relative to the directory.
+            mtime_ns (int): The file's current modification time.
+            size (int): The file's current size.
+            length (int): The number of bytes sampled.
+        Returns:
+            str: The cached sample, or None if there is none or the file has changed.
+        """
+        row = self._conn.execute("SELECT content FROM samples WHERE path = ? AND mtime_ns = ? AND size = ? AND length = ?",
+                                 (self._key(path), mtime_ns, size, length)).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, rows: List[Tuple[str, int, int, int, str]]):
+        """
+        Stores samples in a single transaction.
+        Args:
+            rows (List[Tuple[str, int, int, int, str]]): (path, mtime_ns, size, length, content) per file.
+        """
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO samples (path, mtime_ns, size, length, content) VALUES (?, ?, ?, ?, ?)",
+                                   ((self._key(path), *rest) for path, *rest in rows))
+
+    def retain(self, paths: Iterator[str]):
+        """
+        Drops the samples of files that are no longer in the directory, such as files
+        moved by a previous organization, so the snapshot only holds the current scan.
+        Args:
+            paths (Iterator[str]): The relative paths of the files that were scanned.
+        """
+        with self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS scanned (path BLOB PRIMARY KEY)")
+            self._conn.execute("DELETE FROM scanned")
+            self._conn.executemany("INSERT OR IGNORE INTO scanned (path) VALUES (?)", ((self._key(path),) for path in paths))
+            self._conn.execute("DELETE FROM samples WHERE path NOT IN (SELECT path FROM scanned)")
+
+
+_default_clients: Dict[str, OllamaClient] = {}
+
+
+def get_default_client(model: str, keep_alive=None) -> OllamaClient:
+    """
+    Returns the process-wide OllamaClient for a model, creating it on first use.
+    Args:
+        model (str): The name of the Ollama model to use.
+        keep_alive (str | int): How long the server keeps the model loaded; used on creation.
+    Returns:
+        OllamaClient: The shared client.
+    """
+    if model not in _default_clients:
+        _default_clients[model] = OllamaClient(model, keep_alive)
+    return _default_clients[model]
+
+
+class IndexedFile(NamedTuple):
+    """
+    One indexed file. A tuple rather than a dict, since an index can hold many thousands.
+    """
+    path: str
+    file_type: str
+    content_summary: str
+
+
 class FileOrganizer:
     """
     Organizes files in a directory based on an AI-generated plan.
     """
-    def __init__(self, directory: str, recursive: bool, ollama_client: OllamaClient, batch_size: int, text_extensions: list, max_content_length: int):
+    # Worker threads used to read file samples while indexing.
+    READ_WORKERS = 32
+    # Worker threads used to move files when executing a plan.
+    MOVE_WORKERS = 16
+    # Where a dry run saves its plan for --reuse-plan.
+    PLAN_FILENAME = ".broom_plan.json"
+    # Indexing should not count as an access, so skip the atime update where the OS supports it.
+    _READ_FLAGS = os.O_RDONLY | getattr(os, 'O_NOATIME', 0)
+    # Samples that say nothing about the content, so they never mark files as duplicates.
+    _PLACEHOLDER_SAMPLES = frozenset({"Binary file.", "<Empty file>"})
+    # Even a batch of long samples keeps a few files, so the AI has something to group.
+    MIN_BATCH_FILES = 5
+    # A grouped request holds at most this many batches, since the AI echoes every path back.
+    MAX_GROUP_BATCHES = 4
+    # Stop sending batches once this many requests in a row have failed.
+    MAX_CONSECUTIVE_FAILURES = 3
+
+    def __init__(self, directory: str, recursive: bool, ollama_client: OllamaClient, batch_size: int, text_extensions: FrozenSet[str], max_content_length: int,
+                 prompt_char_budget: int = 0, plan_cache: "PlanCache" = None, concurrency: int = 4,
+                 prompt_content_chars: int = 256, binary_extensions: FrozenSet[str] = frozenset(), batch_chars: int = 0,
+                 sample_cache: "SampleCache" = None, extension_categories: Dict[str, str] = None):
         self.directory = directory
+        # Plan paths are relative to the directory, so absolute paths are built by concatenation.
+        self._root = os.path.join(directory, '')
         self.recursive = recursive
         self.ollama_client = ollama_client
         self.batch_size = batch_size
-        self.text_extensions = text_extensions
+        self.batch_chars = batch_chars
+        # Checked once per indexed file, so keep it as a set for O(1) lookups.
+        self.text_extensions = frozenset(ext.lower() for ext in text_extensions)
+        self.binary_extensions = frozenset(ext.lower() for ext in binary_extensions)
+        self.extension_categories = {ext.lower(): category for ext, category in (extension_categories or {}).items()}
+        # Files whose sample would never be used: known binary formats, and types that are
+        # placed by extension without asking the AI.
+        self._unsampled_extensions = self.binary_extensions | frozenset(self.extension_categories)
         self.max_content_length = max_content_length
-
-    def index(self) -> List[Dict[str, str]]:
+        self.prompt_char_budget = prompt_char_budget
+        self.plan_cache = plan_cache
+        self.sample_cache = sample_cache
+        self._read_buffers = threading.local()
+        self.concurrency = concurrency
+        self.prompt_content_chars = prompt_content_chars
+        # Fingerprint of the indexed files, saved with a dry run's plan.
+        self._signature = None
+        # Paths held back from the AI as copies of another file, keyed by that file's path.
+        self._duplicates: Dict[str, List[str]] = {}
+
+    def index(self) -> List[IndexedFile]:
         """
         Indexes files in the specified directory.
         Returns:
-            List[Dict[str, str]]: A list of dictionaries, each representing a file.
+            List[IndexedFile]: The indexed files.
         """
         print(f"➡️  Step 1: Indexing all files {'recursively' if self.recursive else ''} in '{self.directory}'...")
-        files_index = []
-
-        iterator = os.walk(self.directory) if self.recursive else [(self.directory, [], os.listdir(self.directory))]
-
-        for root, _, filenames in iterator:
-            for filename in filenames:
-                if filename.startswith('.') or filename in [".broom_log.json", ".broom_undo.json"]:
+        candidates = []
+        stats = {}
+        cached = {}
+        for entry in self._scandir_recursive(self.directory):
+            _, dot, ext = entry.name.rpartition('.')
+            file_ext = '.' + ext.lower() if dot else ''
+            relative_path = os.path.relpath(entry.path, self.directory)
+            candidates.append((relative_path, file_ext, entry.path))
+            if self.sample_cache is not None and file_ext not in self._unsampled_extensions:
+                # A stat is much cheaper than opening and reading the file again.
+                try:
+                    st = entry.stat()
+                except OSError:
                     continue
-
-                filepath = os.path.join(root, filename)
-                if not os.path.isfile(filepath):
+                stats[entry.path] = (relative_path, st.st_mtime_ns, st.st_size)
+                content = self.sample_cache.get(relative_path, st.st_mtime_ns, st.st_size, self.max_content_length)
+                if content is not None:
+                    cached[entry.path] = content
+        self._signature = self._file_signature(c[0] for c in candidates)
+
+        # Reading the samples is I/O-bound, so overlap the reads on a thread pool.
+        to_read = [(path, file_ext) for _, file_ext, path in candidates if path not in cached]
+        with ThreadPoolExecutor(max_workers=self.READ_WORKERS) as executor:
+            read = dict(zip((c[0] for c in to_read), executor.map(self._read_sample, *zip(*to_read)))) if to_read else {}
+        if self.sample_cache is not None:
+            self.sample_cache.retain(stat[0] for stat in stats.values())
+            self.sample_cache.put_many([(*stats[path], self.max_content_length, content)
+                                        for path, content in read.items() if path in stats])
+        if cached:
+            print(f"   - Reused {len(cached)} unchanged file sample(s).")
+        contents = (cached[path] if path in cached else read[path] for _, _, path in candidates)
+
+        # Text files with the same type and sample are checked byte for byte; true copies
+        # are held back from the AI and placed in whichever category the first one gets.
+        files_index = []
+        firsts: Dict[tuple, Tuple[str, str]] = {}
+        digests: Dict[str, bytes] = {}
+        self._duplicates = {}
+        for (relative_path, file_ext, path), content in zip(candidates, contents):
+            if content not in self._PLACEHOLDER_SAMPLES:
+                key = (file_ext, hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest())
+                first_relative, first_path = firsts.setdefault(key, (relative_path, path))
+                if first_relative != relative_path and self._same_content(first_path, path, digests):
+                    self._duplicates.setdefault(first_relative, []).append(relative_path)
                     continue
+            # The full sample decides binary vs text; the AI only needs its start,
+            # and for binary files the type says all the placeholder would.
+            summary = "" if content == "Binary file." else content[:self.prompt_content_chars].replace('\n', ' ')
+            files_index.append(IndexedFile(relative_path, file_ext, summary))
+
+        duplicate_count = sum(len(d) for d in self._duplicates.values())
+        print(f"✅ Indexed {len(files_index) + duplicate_count} files"
+              + (f" ({duplicate_count} duplicates will follow their originals)." if duplicate_count else "."))
+        return files_index
 
-                relative_path = os.path.relpath(filepath, self.directory)
-                file_ext = os.path.splitext(filename)[1].lower()
-
-                # Improved file type detection: try to read all files as text by default,
-                # and only classify as binary if it contains null bytes or is unreadable.
-                try:
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        content_sample = f.read(self.max_content_length)
-
-                    # Heuristic: If a file contains a null byte, it's likely binary.
-                    # We make an exception for known text types that might contain them.
-                    if '\x00' in content_sample and file_ext not in self.text_extensions:
-                        content = "Binary file."
-                    else:
-                        content = content_sample if content_sample else "<Empty file>"
-                except (IOError, OSError):
-                    content = "Binary file." # Can't be opened in text mode.
-                except Exception:
-                    content = "<Unreadable>" # Other unexpected errors.
-
-                files_index.append({"path": relative_path, "file_type": file_ext, "content_summary": content})
-
-            if not self.recursive:
-                break
+    @classmethod
+    def _same_content(cls, path_a: str, path_b: str, digests: Dict[str, bytes]) -> bool:
+        """
+        Checks whether two files have identical contents, treating unreadable files as different.
+        Only called when their samples match, so files that differ only after the sample
+        (CSV exports, filled-in templates) are not mistaken for copies.
+        Args:
+            path_a (str): The absolute path of the first file.
+            path_b (str): The absolute path of the second file.
+            digests (Dict[str, bytes]): Content hashes already computed during this index.
+        Returns:
+            bool: True if both files could be read and have the same contents.
+        """
+        try:
+            if os.path.getsize(path_a) != os.path.getsize(path_b):
+                return False
+            for path in (path_a, path_b):
+                if path not in digests:
+                    digests[path] = cls._content_digest(path)
+        except OSError:
+            return False
+        return digests[path_a] == digests[path_b]
 
+    @staticmethod
+    def _content_digest(path: str) -> bytes:
+        """
+        Hashes the full contents of a file.
+        Args:
+            path (str): The absolute path of the file.
+        Returns:
+            bytes: The file's blake2b digest.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.digest()
 
-        print(f"✅ Indexed {len(files_index)} files.")
-        return files_index
+    def _expand_duplicates(self, final_plan: Dict[str, List[str]]):
+        """
+        Adds the duplicates held back from the AI to the categories of their originals.
+        Args:
+            final_plan (Dict[str, List[str]]): The merged plan, updated in place.
+        """
+        if not self._duplicates:
+            return
+        for category, paths in final_plan.items():
+            final_plan[category] = [p for path in paths for p in (path, *self._duplicates.get(path, ()))]
 
-    def organize(self, dry_run: bool, skip_confirmation: bool, stream: bool = False):
+    def _scandir_recursive(self, path: str) -> Iterator[os.DirEntry]:
+        """
+        Yields the files in a directory, then those of its subdirectories when recursive.
+        Each level of the tree is listed concurrently, but files are yielded in the same
+        depth-first order as a sequential walk so batches stay stable between runs.
+        Args:
+            path (str): The directory to scan.
+        Yields:
+            os.DirEntry: The entry of each file found.
+        """
+        files, subdirs = self._list_directory(path)
+        if not subdirs:
+            yield from files
+            return
+        listings = {path: (files, subdirs)}
+        with ThreadPoolExecutor(max_workers=self.READ_WORKERS) as executor:
+            level = subdirs
+            while level:
+                next_level = []
+                for subdir, listing in zip(level, executor.map(self._list_directory, level)):
+                    listings[subdir] = listing
+                    next_level.extend(listing[1])
+                level = next_level
+        stack = [path]
+        while stack:
+            files, subdirs = listings.pop(stack.pop())
+            yield from files
+            stack.extend(reversed(subdirs))
+
+    def _list_directory(self, path: str) -> Tuple[List[os.DirEntry], List[str]]:
+        """
+        Lists one directory. Hidden entries and Broom's own log files are skipped.
+        DirEntry caches the file type reported by the listing, so no extra stat is needed.
+        Args:
+            path (str): The directory to list.
+        Returns:
+            Tuple[List[os.DirEntry], List[str]]: The file entries, and the subdirectory
+            paths to descend into when recursive.
+        """
+        files, subdirs = [], []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Broom's own files (.broom_undo.json, .broom_plan.json) are hidden too.
+                    if entry.name[0] == '.':
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.recursive:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry)
+        except OSError:
+            pass # Unreadable directories are skipped, as os.walk did.
+        return files, subdirs
+
+    def _read_sample(self, filepath: str, file_ext: str) -> str:
+        """
+        Reads the start of a file to summarize its content for the AI.
+        Args:
+            filepath (str): The absolute path of the file.
+            file_ext (str): The lower-cased file extension.
+        Returns:
+            str: The content sample, or a placeholder for binary, empty or unreadable files.
+        """
+        # Improved file type detection: try to read all files as text by default,
+        # and only classify as binary if it contains null bytes or is unreadable.
+        # The sample is read as raw bytes so binary files are never run through the decoder.
+        if file_ext in self._unsampled_extensions:
+            return "Binary file." # Known binary formats and pre-categorized types are not worth a read.
+        try:
+            try:
+                fd = os.open(filepath, self._READ_FLAGS)
+            except PermissionError:
+                # O_NOATIME is only allowed on files we own; open others normally.
+                fd = os.open(filepath, os.O_RDONLY)
+            try:
+                if hasattr(os, 'readv'):
+                    # Each worker thread reads into its own reused buffer instead of a new bytes object.
+                    buffer = getattr(self._read_buffers, 'buffer', None)
+                    if buffer is None:
+                        buffer = self._read_buffers.buffer = bytearray(self.max_content_length)
+                    raw_sample = memoryview(buffer)[:os.readv(fd, [buffer])]
+                else:
+                    raw_sample = memoryview(os.read(fd, self.max_content_length))
+            finally:
+                os.close(fd)
+        except OSError:
+            return "Binary file." # Can't be opened.
+
+        # Heuristic: If a file contains a null byte, it's likely binary.
+        # We make an exception for known text types that might contain them.
+        if raw_sample.obj.find(b'\x00', 0, len(raw_sample)) != -1 and file_ext not in self.text_extensions:
+            return "Binary file."
+        return str(raw_sample, 'utf-8', errors='ignore') or "<Empty file>"
+
+    def organize(self, dry_run: bool, skip_confirmation: bool, stream: bool = False, reuse_plan: bool = False):
         """
         Runs the file organization process.
         Args:
             dry_run (bool): If True, shows the plan without moving anything.
             skip_confirmation (bool): If True, skips the confirmation prompt.
             stream (bool): If True, streams the AI response in real-time.
+            reuse_plan (bool): If True, applies the plan saved by the last dry run when the files are unchanged.
+        """
+        final_plan = self._load_saved_plan() if reuse_plan else None
+        if final_plan is None:
+            final_plan = self._create_plan(stream)
+            if dry_run:
+                self._save_plan(final_plan)
+
+        Broom.display_plan(final_plan, "files", self.recursive)
+        if not dry_run and (skip_confirmation or input("Apply this plan? (y/N): ").lower().strip() == 'y'):
+            self.execute_plan(final_plan)
+            self._discard_saved_plan()
+        else:
+            if not dry_run:
+                print("Aborted by user.")
+            print("\n🏁 This was a DRY RUN. No items were moved.")
+
+    def _create_plan(self, stream: bool) -> Dict[str, List[str]]:
+        """
+        Indexes the files and asks the AI to categorize them.
+        Args:
+            stream (bool): If True, streams the AI response in real-time.
+        Returns:
+            Dict[str, List[str]]: The organization plan, mapping each category to file paths.
         """
         file_index = self.index()
         if not file_index:
             sys.exit("No files found to organize.")
 
-        batches = [file_index[i:i + self.batch_size] for i in range(0, len(file_index), self.batch_size)]
         final_plan = {}
+        final_plan_seen: Dict[str, set] = {}
+        # Media and archives are categorized by their type alone; only the rest needs the AI.
+        needs_ai = []
+        for f in file_index:
+            category = self.extension_categories.get(f.file_type)
+            if category is None:
+                needs_ai.append(f)
+            else:
+                self._merge_category(final_plan, final_plan_seen, category, [f.path])
+        if len(needs_ai) < len(file_index):
+            print(f"   - Categorized {len(file_index) - len(needs_ai)} file(s) by type.")
+        if not needs_ai:
+            self._expand_duplicates(final_plan)
+            return final_plan
+
+        batches = self._pack_batches(needs_ai)
+        # From here on the batches hold the only references to the indexed files,
+        # so each one can be released as soon as it has been serialized.
+        del file_index, needs_ai
 
         if stream:
             print(f"\n➡️  Step 2: Analyzing files in {len(batches)} batches sequentially (streaming)...")
-            for i, batch in enumerate(tqdm(batches, desc="Processing Batches")):
-                file_data_str = json.dumps(batch)
-                prompt = f"Task: Categorize files based on path, file_type, and content. Output ONLY JSON with one key 'organization_plan'. Data: {file_data_str}"
+            for i in tqdm(range(len(batches)), desc="Processing Batches"):
+                system, prompt = self._build_prompt([self._serialize_batch(batches[i])])
+                batches[i] = None
 
                 print(f"\n--- Batch {i+1}/{len(batches)} ---")
-                full_response_content = ""
-                for chunk in self.ollama_client.get_plan_stream(prompt):
-                    print(chunk, end='', flush=True)
-                    full_response_content += chunk
-                print("\n")
-
                 try:
-                    response_data = json.loads(full_response_content)
-                    partial_plan = response_data.get("organization_plan", {})
-                    for category, files in partial_plan.items():
-                        final_plan.setdefault(category, []).extend([f for f in files if f not in final_plan.get(category, [])])
-                except json.JSONDecodeError:
-                    print(f"\n⚠️ Warning: Could not decode AI response for batch {i+1}")
+                    for category, files in iter_plan_items(echo_chunks(self.ollama_client.get_plan_stream(prompt, system))):
+                        self._merge_category(final_plan, final_plan_seen, category, files)
+                except PLAN_STREAM_ERRORS:
+                    # Categories that completed before the error have already been merged.
+                    print(f"\n⚠️ Warning: Could not decode the rest of the AI response for batch {i+1}")
 
         else:
-            print(f"\n➡️  Step 2: Analyzing files in {len(batches)} batches concurrently...")
-            with ThreadPoolExecutor() as executor:
-                futures = []
-                for i, batch in enumerate(batches):
-                    file_data_str = json.dumps(batch)
-                    prompt = f"Task: Categorize files based on path, file_type, and content. Output ONLY JSON with one key 'organization_plan'. Data: {file_data_str}"
-                    futures.append(executor.submit(self.ollama_client.get_file_batch_plan_sync, prompt, i + 1))
-
-                results = [future.result() for future in tqdm(futures, desc="Processing Batches")]
-
-            for response in results:
-                if response:
-                    content = response.get('message', {}).get('content', '{}')
-                    try:
-                        partial_plan = json.loads(content).get("organization_plan", {})
-                        for category, files in partial_plan.items():
-                            final_plan.setdefault(category, []).extend([f for f in files if f not in final_plan.get(category, [])])
-                    except json.JSONDecodeError:
+            batch_data = []
+            for i in range(len(batches)):
+                batch_data.append(self._serialize_batch(batches[i]))
+                batches[i] = None
+            groups = self._group_batches(batch_data)
+            prompts = [self._build_prompt([batch_data[j] for j in group]) for group in groups]
+            print(f"\n➡️  Step 2: Analyzing files in {len(batches)} batches across {len(prompts)} AI request(s)...")
+            results = self._request_plans(prompts, [PLAN_SCHEMA if len(group) == 1 else GROUPED_PLAN_SCHEMA for group in groups])
+
+            retry_batches = []
+            for group, prompt, content in zip(groups, prompts, results):
+                if content is None:
+                    continue
+                try:
+                    partial_plans = self._parse_partial_plans(content, len(group))
+                except json.JSONDecodeError:
+                    if len(group) == 1:
                         print(f"⚠️ Warning: Could not decode AI response: {content}")
+                        continue
+                    partial_plans = None
+                if partial_plans is None:
+                    retry_batches.extend(group)
+                    continue
+                self._remember(prompt, content)
+                self._merge_plans(final_plan, final_plan_seen, partial_plans)
+
+            if retry_batches:
+                # The combined response was unusable; fall back to one request per batch.
+                print(f"⚠️ Warning: Retrying {len(retry_batches)} batches individually.")
+                retry_prompts = [self._build_prompt([batch_data[j]]) for j in retry_batches]
+                for prompt, content in zip(retry_prompts, self._request_plans(retry_prompts)):
+                    if content is not None:
+                        try:
+                            self._merge_plans(final_plan, final_plan_seen, self._parse_partial_plans(content, 1))
+                            self._remember(prompt, content)
+                        except json.JSONDecodeError:
+                            print(f"⚠️ Warning: Could not decode AI response: {content}")
+
+        self._expand_duplicates(final_plan)
+        return final_plan
+
+    def _file_signature(self, relative_paths: Iterator[str]) -> str:
+        """
+        Fingerprints the set of files a plan was made for.
+        Args:
+            relative_paths (Iterator[str]): The indexed paths, relative to the directory.
+        Returns:
+            str: A hex BLAKE2b digest of the sorted paths and the indexing mode.
+        """
+        digest = hashlib.blake2b(b"recursive" if self.recursive else b"flat", digest_size=16)
+        for path in sorted(relative_paths):
+            digest.update(b"\0" + path.encode('utf-8', errors='surrogateescape'))
+        return digest.hexdigest()
 
-        Broom.display_plan(final_plan, "files", self.recursive)
-        if not dry_run and (skip_confirmation or input("Apply this plan? (y/N): ").lower().strip() == 'y'):
-            self.execute_plan(final_plan)
-        else:
-            if not dry_run:
-                print("Aborted by user.")
-            print("\n🏁 This was a DRY RUN. No items were moved.")
+    def _save_plan(self, plan: Dict[str, List[str]]):
+        """
+        Saves a dry run's plan so the next run can apply it with --reuse-plan.
+        Args:
+            plan (Dict[str, List[str]]): The organization plan.
+        """
+        try:
+            with open(self._root + self.PLAN_FILENAME, 'w', encoding='utf-8') as f:
+                f.write(json_dumps({"signature": self._signature, "plan": plan}))
+            print(f"\n💾 Plan saved. Run again with --reuse-plan to apply it without re-analyzing.")
+        except OSError as e:
+            print(f"\n⚠️ Warning: Could not save the plan: {e}")
+
+    def _load_saved_plan(self):
+        """
+        Loads the plan saved by the last dry run, if the directory still holds the same files.
+        Returns:
+            Dict[str, List[str]]: The saved plan, or None if there is none or it is out of date.
+        """
+        try:
+            with open(self._root + self.PLAN_FILENAME, 'rb') as f:
+                saved = json_loads(f.read())
+        except FileNotFoundError:
+            print("⚠️  Warning: No saved plan found. Building a new one.")
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  Warning: Could not read the saved plan ({e}). Building a new one.")
+            return None
+
+        # Listing the directory is cheap next to reading every file and asking the AI.
+        relative_paths = (os.path.relpath(entry.path, self.directory) for entry in self._scandir_recursive(self.directory))
+        if not isinstance(saved, dict) or saved.get("signature") != self._file_signature(relative_paths):
+            print("⚠️  Warning: The files have changed since the plan was saved. Building a new one.")
+            return None
+        print("♻️  Reusing the plan saved by the last dry run.")
+        return saved.get("plan", {})
+
+    def _discard_saved_plan(self):
+        """
+        Removes the saved plan, which no longer matches the directory once it has been applied.
+        """
+        try:
+            os.remove(self._root + self.PLAN_FILENAME)
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def _merge_plans(cls, final_plan: Dict[str, List[str]], final_plan_seen: Dict[str, set], partial_plans: List[dict]):
+        """
+        Merges the per-batch plans parsed from an AI response into the plan.
+        Args:
+            final_plan (Dict[str, List[str]]): The plan being built.
+            final_plan_seen (Dict[str, set]): The paths already in each category of the plan.
+            partial_plans (List[dict]): The 'organization_plan' objects of the response.
+        """
+        for partial_plan in partial_plans:
+            for category, files in partial_plan.items():
+                cls._merge_category(final_plan, final_plan_seen, category, files)
+
+    @staticmethod
+    def _merge_category(final_plan: Dict[str, List[str]], final_plan_seen: Dict[str, set], category: str, files: list):
+        """
+        Appends a category's files to the plan, skipping files it already holds.
+        Items are normalized to path strings here so the plan only ever holds one type.
+        Args:
+            final_plan (Dict[str, List[str]]): The plan being built.
+            final_plan_seen (Dict[str, set]): The paths already in each category of the plan.
+            category (str): The category name.
+            files (list): The files the AI placed in the category, as paths or {'path': ...} objects.
+        """
+        seen = final_plan_seen.setdefault(category, set())
+        bucket = final_plan.setdefault(category, [])
+        for f in files:
+            path = f.get('path') if isinstance(f, dict) else f
+            if isinstance(path, str) and path not in seen:
+                seen.add(path)
+                bucket.append(path)
+
+    def _pack_batches(self, file_index: List[IndexedFile]) -> List[List[IndexedFile]]:
+        """
+        Splits the indexed files into batches of at most batch_size files. With a character
+        budget, a batch is also closed once its data would exceed it, so long samples do
+        not overflow the prompt; the AI must echo every path, so files with short or empty
+        samples still stop at batch_size.
+        Args:
+            file_index (List[IndexedFile]): The indexed files.
+        Returns:
+            List[List[IndexedFile]]: The batches, in order.
+        """
+        if self.batch_chars <= 0:
+            return [file_index[i:i + self.batch_size] for i in range(0, len(file_index), self.batch_size)]
+        batches, current, size = [], [], 0
+        for f in file_index:
+            # Approximates the serialized size without encoding every file.
+            item_size = len(f.path) + len(f.file_type) + len(f.content_summary) + 8
+            if len(current) >= self.batch_size or (len(current) >= self.MIN_BATCH_FILES and size + item_size > self.batch_chars):
+                batches.append(current)
+                current, size = [], 0
+            current.append(f)
+            size += item_size
+        if current:
+            batches.append(current)
+        return batches
+
+    def _group_batches(self, batch_data: List[str]) -> List[List[int]]:
+        """
+        Packs consecutive batches into groups that are sent to the AI in a single request,
+        up to MAX_GROUP_BATCHES batches so the response stays short enough to complete.
+        Batches are only combined while at least `concurrency` requests remain, since
+        separate requests are answered in parallel but one long response is decoded serially.
+        Args:
+            batch_data (List[str]): The JSON-serialized batches.
+        Returns:
+            List[List[int]]: The batch indices of each request, in order.
+        """
+        max_batches = min(self.MAX_GROUP_BATCHES, max(1, len(batch_data) // max(1, self.concurrency)))
+        groups, current, size = [], [], 0
+        for i, data in enumerate(batch_data):
+            if current and (size + len(data) > self.prompt_char_budget or len(current) >= max_batches):
+                groups.append(current)
+                current, size = [], 0
+            current.append(i)
+            size += len(data)
+        if current:
+            groups.append(current)
+        return groups
+
+    @staticmethod
+    def _serialize_batch(batch: List[IndexedFile]) -> str:
+        """
+        Serializes a batch as parallel arrays rather than one object per file,
+        so the field names are not repeated (and tokenized) for every file.
+        Args:
+            batch (List[IndexedFile]): The indexed files of the batch.
+        Returns:
+            str: The JSON payload.
+        """
+        return json_dumps({
+            "paths": [f.path for f in batch],
+            "types": [f.file_type for f in batch],
+            "contents": [f.content_summary for f in batch],
+        })
+
+    # Fixed prompt text, built once so every batch only appends its data.
+    _PROMPT_LAYOUT = ("Index i of the 'paths', 'types' and 'contents' arrays describes the same file; an empty content "
+                      "means the file is binary. List files by their path.")
+    BATCH_SYSTEM_PROMPT = (f"Task: Categorize files based on path, file_type, and content. {_PROMPT_LAYOUT} "
+                           f"Output ONLY JSON with one key 'organization_plan'.")
+    GROUPED_SYSTEM_PROMPT = (f"Task: For each of the numbered groups given, categorize its files based on path, file_type, and content. "
+                             f"{_PROMPT_LAYOUT} "
+                             f"Output ONLY JSON with one key 'plans': a list holding, in group order, one object with one key 'organization_plan' per group.")
+
+    @classmethod
+    def _build_prompt(cls, batch_data: List[str]) -> Tuple[str, str]:
+        """
+        Builds the categorization prompt for one or more serialized batches.
+        Args:
+            batch_data (List[str]): The JSON-serialized batches to include.
+        Returns:
+            Tuple[str, str]: The system instructions and the user message holding the data.
+        """
+        if len(batch_data) == 1:
+            return cls.BATCH_SYSTEM_PROMPT, "Data: " + batch_data[0]
+        return cls.GROUPED_SYSTEM_PROMPT, "Groups: " + " ".join(f"[{i}] {data}" for i, data in enumerate(batch_data))
+
+    @staticmethod
+    def _parse_partial_plans(content: str, group_size: int):
+        """
+        Extracts the per-batch plans from an AI response.
+        Args:
+            content (str): The JSON content of the response.
+            group_size (int): The number of batches the request covered.
+        Returns:
+            list: One plan per batch, or None if a grouped response does not match the request.
+        """
+        response_data = json_loads(content)
+        if group_size == 1:
+            return [response_data.get("organization_plan", {})]
+        plans = response_data.get("plans")
+        if not isinstance(plans, list) or len(plans) != group_size:
+            return None
+        return [plan.get("organization_plan", {}) if isinstance(plan, dict) else {} for plan in plans]
+
+    def _request_plans(self, prompts: List[Tuple[str, str]], schemas: List[dict] = None) -> List[str]:
+        """
+        Sends the prompts to the AI, concurrently when there is more than one.
+        Prompts with a cached response are answered from the plan cache instead.
+        Args:
+            prompts (List[Tuple[str, str]]): The (system, user) prompts to send.
+            schemas (List[dict]): The response schema for each prompt; PLAN_SCHEMA by default.
+        Returns:
+            List[str]: The JSON content of each response, or None where a request failed, in prompt order.
+        """
+        results = [None] * len(prompts)
+        if self.plan_cache is not None:
+            for i, prompt in enumerate(prompts):
+                results[i] = self.plan_cache.get(self._cache_key(prompt))
+        misses = [i for i, result in enumerate(results) if result is None]
+        schemas = schemas or [PLAN_SCHEMA] * len(prompts)
+        if len(misses) < len(prompts):
+            print(f"   - Reusing {len(prompts) - len(misses)} cached AI response(s).")
+
+        if len(misses) == 1:
+            # A single request gains nothing from a worker pool; call the model directly.
+            i = misses[0]
+            system, prompt = prompts[i]
+            results[i] = self.ollama_client.get_file_batch_plan_sync(prompt, i + 1, schemas[i], system)
+        elif misses:
+            # Keep only as many requests in flight as the server runs in parallel; extra
+            # workers would just wait in Ollama's queue.
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='ollama') as executor:
+                futures = {executor.submit(self.ollama_client.get_file_batch_plan_sync, prompts[i][1], i + 1, schemas[i], prompts[i][0]): i
+                           for i in misses}
+                failures = 0
+                try:
+                    # Collect responses as they finish, so one slow request does not hold up
+                    # the progress bar; they are still returned in prompt order.
+                    for future in tqdm(as_completed(futures), total=len(futures), desc="Processing Batches"):
+                        results[futures[future]] = future.result()
+                        failures = failures + 1 if results[futures[future]] is None else 0
+                        if failures == self.MAX_CONSECUTIVE_FAILURES:
+                            # The server is down or overloaded; queueing more requests only adds to its load.
+                            skipped = sum(future.cancel() for future in futures)
+                            if skipped:
+                                print(f"\n⚠️ Warning: {failures} AI requests failed in a row. Skipping the remaining {skipped}.")
+                            break
+                except KeyboardInterrupt:
+                    # Drop queued batches so shutting the pool down only waits for in-flight requests.
+                    for future in futures:
+                        future.cancel()
+                    raise
+            if failures == self.MAX_CONSECUTIVE_FAILURES:
+                # Keep the responses of requests that were already in flight.
+                for future, i in futures.items():
+                    if not future.cancelled():
+                        results[i] = future.result()
+        return results
+
+    def _cache_key(self, prompt: Tuple[str, str]) -> str:
+        """
+        Returns the plan cache key for a (system, user) prompt sent to this organizer's model.
+        """
+        return PlanCache.key(self.ollama_client.model, "\0".join(prompt))
+
+    def _remember(self, prompt: Tuple[str, str], content: str):
+        """
+        Stores a successfully parsed AI response in the plan cache, if one is in use.
+        """
+        if self.plan_cache is not None:
+            self.plan_cache.put(self._cache_key(prompt), content)
+
+    def _move_item(self, source_rel_path: str, dest_rel_path: str, undo_log: "UndoLogWriter"):
+        """
+        Moves one file within the organized directory and records it in the undo log
+        right away, so every completed move can be undone even if the run is interrupted.
+        Args:
+            source_rel_path (str): The file's current path, relative to the directory.
+            dest_rel_path (str): The file's new path, relative to the directory.
+            undo_log (UndoLogWriter): The log the move is recorded in.
+        """
+        try:
+            fast_move(self._root + source_rel_path, self._root + dest_rel_path)
+        except FileNotFoundError:
+            return # Moved or deleted since indexing.
+        undo_log.write({"source": source_rel_path, "dest": dest_rel_path})
 
     def execute_plan(self, plan: Dict[str, List[str]]):
         """
@@ -231,35 +1222,67 @@ class FileOrganizer:
             plan (Dict[str, List[str]]): The organization plan.
         """
         print("\n➡️  Step 3: Executing file organization plan...")
-        undo_actions = []
-        item_count = sum(len(items) for items in plan.values())
-
-        with tqdm(total=item_count, desc="Moving files") as pbar:
-            for folder, items in plan.items():
-                target_dir_path = os.path.join(self.directory, folder)
-                os.makedirs(target_dir_path, exist_ok=True)
-                for item in items:
-                    source_rel_path = item['path'] if isinstance(item, dict) else item
-                    source_abs_path = os.path.join(self.directory, source_rel_path)
-
-                    dest_rel_path = os.path.join(folder, os.path.basename(source_rel_path))
-                    dest_abs_path = os.path.join(self.directory, dest_rel_path)
-
-                    if os.path.exists(source_abs_path):
-                        undo_actions.append({"source": source_rel_path, "dest": dest_rel_path})
-                        shutil.move(source_abs_path, dest_abs_path)
+        moves = []
+        claimed_sources, claimed_dests = set(), set()
+        for folder, items in plan.items():
+            os.makedirs(self._root + folder, exist_ok=True)
+            for source_rel_path in items:
+                dest_rel_path = os.path.join(folder, os.path.basename(source_rel_path))
+                # Each source and destination may only be used once.
+                if source_rel_path in claimed_sources:
+                    continue
+                if dest_rel_path in claimed_dests:
+                    print(f"⚠️ Warning: Skipping '{source_rel_path}'; another file is already moving to '{dest_rel_path}'.")
+                    continue
+                claimed_sources.add(source_rel_path)
+                claimed_dests.add(dest_rel_path)
+                moves.append((source_rel_path, dest_rel_path))
+
+        # A move whose destination is another move's source (or the other way round)
+        # depends on their order, so those run first, in plan order. The rest are
+        # independent renames and are overlapped.
+        ordered = [(source, dest) for source, dest in moves if dest in claimed_sources or source in claimed_dests]
+        if ordered:
+            ordered_set = set(ordered)
+            moves = [move for move in moves if move not in ordered_set]
+        with UndoLogWriter(self.directory) as undo_log, ThreadPoolExecutor(max_workers=self.MOVE_WORKERS) as executor, \
+                tqdm(total=len(ordered) + len(moves), desc="Moving files") as pbar:
+            for source_rel_path, dest_rel_path in ordered:
+                try:
+                    self._move_item(source_rel_path, dest_rel_path, undo_log)
+                except OSError as e:
+                    print(f"\n⚠️ Warning: Could not move '{e.filename}': {e}")
+                pbar.update(1)
+            futures = [executor.submit(self._move_item, source_rel_path, dest_rel_path, undo_log)
+                       for source_rel_path, dest_rel_path in moves]
+            try:
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except OSError as e:
+                        print(f"\n⚠️ Warning: Could not move '{e.filename}': {e}")
                     pbar.update(1)
-
-        if undo_actions:
-            UndoManager.save_undo_log(self.directory, undo_actions)
+            except BaseException:
+                # Drop queued moves so an interrupted run stops after the in-flight ones,
+                # which are still logged by their workers.
+                for future in futures:
+                    future.cancel()
+                raise
 
 
 class FolderOrganizer:
     """
     Organizes folders in a directory based on an AI-generated plan.
     """
+    SYSTEM_PROMPT = ("Task: Group folders into parent categories. Rules: "
+                     "1. A group MUST contain 2 or more folders. "
+                     "2. A parent category's name MUST NOT be the same as any of the folders inside it. "
+                     "3. Ungroupable folders go into a special category named '_standalone'. "
+                     "4. Output ONLY JSON with a single key 'organization_plan'.")
+
     def __init__(self, directory: str, ollama_client: OllamaClient):
         self.directory = directory
+        self._root = os.path.join(directory, '')
         self.ollama_client = ollama_client
 
     def index(self) -> List[Dict[str, Any]]:
@@ -269,10 +1292,9 @@ class FolderOrganizer:
             List[Dict[str, Any]]: A list of dictionaries, each representing a folder.
         """
         print(f"➡️  Step 1: Indexing all folders in '{self.directory}'...")
-        folder_index = []
-        for item in os.listdir(self.directory):
-            if os.path.isdir(os.path.join(self.directory, item)) and not item.startswith('.'):
-                folder_index.append({"folder_name": item})
+        # The hidden check comes first so hidden entries never need their type looked up.
+        with os.scandir(self.directory) as entries:
+            folder_index = [{"folder_name": entry.name} for entry in entries if entry.name[0] != '.' and entry.is_dir()]
         print(f"✅ Indexed {len(folder_index)} folders.")
         return folder_index
 
@@ -289,28 +1311,19 @@ class FolderOrganizer:
             sys.exit("No folders found to organize.")
 
         print("\n➡️  Step 2: Analyzing folder structure...")
-        folder_data_str = json.dumps(folder_index)
-        prompt = (f"Task: Group folders into parent categories. Rules: "
-                  f"1. A group MUST contain 2 or more folders. "
-                  f"2. A parent category's name MUST NOT be the same as any of the folders inside it. "
-                  f"3. Ungroupable folders go into a special category named '_standalone'. "
-                  f"4. Output ONLY JSON with a single key 'organization_plan'. Data: {folder_data_str}")
+        prompt = "Data: " + json_dumps(folder_index)
 
         print("   - Asking AI for a folder organization plan...")
 
         if stream:
             print("   - Streaming AI response... (raw JSON will be printed below)")
-            full_response_content = ""
-            for chunk in self.ollama_client.get_plan_stream(prompt):
-                print(chunk, end='', flush=True)
-                full_response_content += chunk
-            print("\n") # Newline after stream finishes
             try:
-                response_data = json.loads(full_response_content)
-            except json.JSONDecodeError:
+                raw_plan = dict(iter_plan_items(echo_chunks(self.ollama_client.get_plan_stream(prompt, self.SYSTEM_PROMPT))))
+            except PLAN_STREAM_ERRORS:
                 sys.exit("\n❌ Could not decode the streamed JSON response from the AI.")
+            response_data = {"organization_plan": raw_plan} if raw_plan else None
         else:
-            response_data = self.ollama_client.get_plan_sync(prompt)
+            response_data = self.ollama_client.get_plan_sync(prompt, self.SYSTEM_PROMPT)
 
         if not response_data or "organization_plan" not in response_data:
             sys.exit("❌ Could not get a valid organization plan from the AI.")
@@ -345,30 +1358,31 @@ class FolderOrganizer:
             plan (Dict[str, List[str]]): The organization plan.
         """
         print("\n➡️  Step 3: Executing folder organization plan...")
-        undo_actions = []
         item_count = sum(len(items) for items in plan.values())
 
-        with tqdm(total=item_count, desc="Moving folders") as pbar:
+        with UndoLogWriter(self.directory) as undo_log, tqdm(total=item_count, desc="Moving folders") as pbar:
             for p_folder, s_folders in plan.items():
                 if p_folder == '_standalone':
                     pbar.update(len(s_folders))
                     continue
-                target_dir = os.path.join(self.directory, p_folder)
+                target_dir = self._root + p_folder
                 os.makedirs(target_dir, exist_ok=True)
                 for s_folder in s_folders:
                     if p_folder == s_folder:
                         pbar.update(1)
                         continue
-                    source_path = os.path.join(self.directory, s_folder)
+                    source_path = self._root + s_folder
                     dest_path = os.path.join(target_dir, s_folder)
                     if os.path.isdir(source_path):
-                        undo_actions.append({"source": s_folder, "dest": os.path.join(p_folder, s_folder)})
-                        shutil.move(source_path, dest_path)
+                        try:
+                            fast_move(source_path, dest_path)
+                            undo_log.write({"source": s_folder, "dest": os.path.join(p_folder, s_folder)})
+                        except FileNotFoundError:
+                            pass # Moved or deleted since indexing.
+                        except OSError as e:
+                            print(f"\n⚠️ Warning: Could not move '{e.filename}': {e}")
                     pbar.update(1)
 
-        if undo_actions:
-            UndoManager.save_undo_log(self.directory, undo_actions)
-
 
 class UndoManager:
     """
@@ -376,18 +1390,6 @@ class UndoManager:
     """
     UNDO_FILENAME = ".broom_undo.json"
 
-    @classmethod
-    def save_undo_log(cls, directory: str, actions: List[Dict[str, str]]):
-        """
-        Saves the undo log to a file.
-        Args:
-            directory (str): The directory where the undo log will be saved.
-            actions (List[Dict[str, str]]): A list of actions to be saved.
-        """
-        with open(os.path.join(directory, cls.UNDO_FILENAME), 'w') as f:
-            json.dump(actions, f, indent=2)
-        print(f"\n📝 Undo log saved. To reverse this action, run with the --undo flag.")
-
     @classmethod
     def run(cls, directory: str):
         """
@@ -399,47 +1401,150 @@ class UndoManager:
         if not os.path.exists(undo_path):
             sys.exit(f"❌ No undo log found at '{undo_path}'. Cannot undo.")
 
-        with open(undo_path, 'r') as f:
-            undo_actions = json.load(f)
+        with open(undo_path, 'rb') as f:
+            data = f.read()
+        if data.lstrip()[:1] == b'[':
+            undo_actions = json_loads(data) # A log written as a single JSON array by older versions.
+        else:
+            undo_actions = [json_loads(line) for line in data.splitlines() if line.strip()]
 
         print(f"↩️  Found {len(undo_actions)} actions to reverse. This will restore the state before the last organization.")
         if input("Proceed with undo? (y/N): ").lower().strip() != 'y':
             sys.exit("Undo aborted by user.")
 
+        root = os.path.join(directory, '')
+        touched_folders = set()
+        created_folders = set()
+        failed = 0
+        # Replay the moves one at a time, newest first: one move's destination can be
+        # another's source, so they are not independent of each other.
         for action in tqdm(reversed(undo_actions), total=len(undo_actions), desc="Undoing moves"):
-            source = os.path.join(directory, action['dest'])
-            dest = os.path.join(directory, action['source'])
-
-            os.makedirs(os.path.dirname(dest), exist_ok=True)
-
-            if os.path.exists(source):
-                shutil.move(source, dest)
-
-        for folder in {os.path.dirname(action['dest']) for action in undo_actions}:
-            folder_path = os.path.join(directory, folder)
+            dest = root + action['source']
+            touched_folders.add(os.path.dirname(action['dest']))
+
+            # Most actions restore into the same few folders; create each one only once.
+            dest_folder = os.path.dirname(dest)
+            if dest_folder not in created_folders:
+                os.makedirs(dest_folder, exist_ok=True)
+                created_folders.add(dest_folder)
+            try:
+                cls._restore(root + action['dest'], dest)
+            except OSError as e:
+                failed += 1
+                print(f"\n⚠️ Warning: Could not move '{e.filename}' back: {e}")
+
+        # Deepest folders first, so a parent emptied by removing its children is removed too.
+        for folder in sorted(touched_folders, key=lambda f: f.count(os.sep), reverse=True):
+            folder_path = root + folder
             if os.path.exists(folder_path) and not os.listdir(folder_path):
                 try:
                     os.rmdir(folder_path)
                 except OSError as e:
                     print(f"⚠️ Warning: Could not remove directory {folder_path}: {e}")
 
+        if failed:
+            # Keep the log so the remaining items can be restored by running the undo again.
+            sys.exit(f"\n⚠️ Undo finished with {failed} item(s) not restored. The undo log was kept.")
         os.remove(undo_path)
         print("\n✅ Undo complete.")
 
+    @staticmethod
+    def _restore(source: str, dest: str):
+        """
+        Moves one item back to where it was before the organization.
+        Args:
+            source (str): The item's current absolute path.
+            dest (str): The item's original absolute path.
+        """
+        try:
+            fast_move(source, dest)
+        except FileNotFoundError:
+            pass # Already moved back or deleted since the organization.
+
+
+class UndoLogWriter:
+    """
+    Appends undo actions to the undo log as the moves happen, one JSON object per line,
+    so the log never has to be held in memory and survives an interrupted run.
+    """
+    def __init__(self, directory: str):
+        self.path = os.path.join(directory, UndoManager.UNDO_FILENAME)
+        self._file = None
+        # Moves running on worker threads record themselves as soon as they complete.
+        self._lock = threading.Lock()
+
+    def write(self, action: Dict[str, str]):
+        """
+        Records one completed move. Safe to call from several threads.
+        Args:
+            action (Dict[str, str]): The move, as its 'source' and 'dest' relative paths.
+        """
+        line = json_dumps(action) + "\n"
+        with self._lock:
+            # The log is only created once something has moved, so a run that moves
+            # nothing leaves the previous log in place.
+            if self._file is None:
+                self._file = open(self.path, 'w', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        """
+        Closes the log, if anything was written to it.
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            print(f"\n📝 Undo log saved. To reverse this action, run with the --undo flag.")
+
+    def __enter__(self) -> "UndoLogWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 
 class Broom:
     """
     An AI-powered file and folder organizer.
     """
     def __init__(self):
+        # Concurrent batch requests are only served in parallel when the Ollama server
+        # allows it: set OLLAMA_NUM_PARALLEL (requests per model) and, if other models
+        # are in use, OLLAMA_MAX_LOADED_MODELS in the server's environment.
+        # OLLAMA_CONCURRENCY should match OLLAMA_NUM_PARALLEL, and defaults to it when set.
         self.config = {
             'OLLAMA_MODEL': 'gemma3:12b',
+            # Keeps the model loaded between batches and across back-to-back runs.
+            'OLLAMA_KEEP_ALIVE': '30m',
             'MAX_CONTENT_LENGTH': 1024,
-            'TEXT_EXTENSIONS': [
+            # How much of each file's content sample is sent to the AI.
+            'PROMPT_CONTENT_CHARS': 256,
+            'TEXT_EXTENSIONS': frozenset({
                 '.txt', '.md', '.py', '.js', '.html', '.css', '.json', '.xml', '.csv',
                 '.sh', '.yaml', '.yml', '.ini', '.log', '.rst', '.tex', '.rtf'
-            ],
+            }),
+            # Files with these extensions are classified as binary without being opened.
+            'BINARY_EXTENSIONS': frozenset({
+                '.jpg', '.jpeg', '.png', '.gif', '.webp', '.mp4', '.mkv', '.mp3', '.flac', '.zip', '.tar',
+                '.gz', '.7z', '.pdf', '.exe', '.dll', '.so', '.dylib', '.bin', '.iso', '.db', '.sqlite'
+            }),
+            # Files with these extensions go straight into the given category without asking the AI.
+            'EXTENSION_CATEGORIES': {
+                **dict.fromkeys(('.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic', '.bmp', '.tiff'), 'Images'),
+                **dict.fromkeys(('.mp4', '.mkv', '.mov', '.avi', '.webm'), 'Videos'),
+                **dict.fromkeys(('.mp3', '.flac', '.wav', '.m4a', '.ogg'), 'Audio'),
+                **dict.fromkeys(('.zip', '.tar', '.gz', '.7z', '.rar'), 'Archives'),
+                **dict.fromkeys(('.dmg', '.iso', '.exe', '.msi', '.pkg'), 'Installers'),
+            },
             'BATCH_SIZE': 30,
+            # Batches are also closed at this many characters of data; 0 limits them by BATCH_SIZE alone.
+            'BATCH_CHARS': 8000,
+            'OLLAMA_CONCURRENCY': env_positive_int('OLLAMA_NUM_PARALLEL', 4),
+            # Consecutive batches are combined into one AI request while their data fits this many characters.
+            'PROMPT_CHAR_BUDGET': 24000,
         }
         self.parser = self._create_parser()
 
@@ -457,6 +1562,13 @@ class Broom:
         parser.add_argument("--dry-run", action="store_true", help="Show the plan without moving anything.")
         parser.add_argument("-y", "--yes", action="store_true", help="Skip confirmation and execute the plan.")
         parser.add_argument("--stream", action="store_true", help="Stream the AI's response in real-time (folders mode only).")
+        parser.add_argument("--concurrency", type=int, default=self.config['OLLAMA_CONCURRENCY'],
+                            help="Maximum number of concurrent AI requests (files mode). Match the server's OLLAMA_NUM_PARALLEL.")
+        parser.add_argument("--batch-chars", type=int, default=self.config['BATCH_CHARS'],
+                            help="Pack files into batches of about this many characters (files mode). 0 uses fixed-size batches.")
+        parser.add_argument("--reuse-plan", action="store_true",
+                            help="Apply the plan saved by the last --dry-run if the files are unchanged (files mode).")
+        parser.add_argument("--no-cache", action="store_true", help="Re-read every file and ask the AI instead of reusing cached samples and responses (files mode).")
         return parser
 
     @staticmethod
@@ -468,25 +1580,27 @@ class Broom:
             mode (str): The organization mode ('files' or 'folders').
             recursive (bool): Whether the file indexing was recursive.
         """
-        print("\n✨ Here is the final proposed organization plan:")
-        print("─" * 40)
+        # Built up and written once; a print per line is slow on large plans.
+        lines = ["\n✨ Here is the final proposed organization plan:", "─" * 40]
         if mode == 'files':
-            for folder, items in sorted(plan.items()):
-                paths = [item['path'] if isinstance(item, dict) else item for item in items]
-                print(f"📁 Create folder: '{folder}'")
-                for path in sorted(paths)[:5]:
-                    print(f"    └── Move '{path}'")
+            for folder, paths in sorted(plan.items()):
+                lines.append(f"📁 Create folder: '{folder}'")
+                lines.extend(f"    └── Move '{path}'" for path in heapq.nsmallest(5, paths))
                 if len(paths) > 5:
-                    print(f"    └── and {len(paths) - 5} more...")
+                    lines.append(f"    └── and {len(paths) - 5} more...")
         else:
-            standalone = plan.pop('_standalone', [])
+            # The plan is executed afterwards, so leave '_standalone' in it.
+            standalone = plan.get('_standalone', [])
             for p_folder, s_folders in sorted(plan.items()):
-                print(f"📁 Create parent folder: '{p_folder}'")
-                for s_folder in sorted(s_folders):
-                    print(f"    └── Move folder '{s_folder}' into it")
+                if p_folder == '_standalone':
+                    continue
+                lines.append(f"📁 Create parent folder: '{p_folder}'")
+                lines.extend(f"    └── Move folder '{s_folder}' into it" for s_folder in sorted(s_folders))
             if standalone:
-                print(f"\n👉 {len(standalone)} folders will be left as they are.")
-        print("─" * 40)
+                lines.append(f"\n👉 {len(standalone)} folders will be left as they are.")
+        lines.append("─" * 40)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def run(self):
         """
@@ -499,9 +1613,11 @@ class Broom:
             print("⚠️  Warning: Streaming for files is sequential and does not run concurrently.")
 
         if not any(arg in ['--undo', '-h', '--help'] for arg in sys.argv):
-            ollama_client = OllamaClient(self.config['OLLAMA_MODEL'])
+            ollama_client = get_default_client(self.config['OLLAMA_MODEL'], self.config['OLLAMA_KEEP_ALIVE'])
             if not ollama_client.check_connection():
                 sys.exit(1)
+            # Load the model in the background while the directory is being indexed.
+            threading.Thread(target=ollama_client.warm_up, daemon=True).start()
         else:
             ollama_client = None
 
@@ -520,15 +1636,33 @@ class Broom:
             sys.exit(f"❌ Error: Directory '{target_directory}' not found.")
 
         if args.mode == 'files':
+            plan_cache = sample_cache = None
+            if not args.no_cache:
+                try:
+                    plan_cache = PlanCache()
+                except (OSError, sqlite3.Error) as e:
+                    print(f"⚠️  Warning: AI response cache is unavailable ({e}).")
+                try:
+                    sample_cache = SampleCache(target_directory)
+                except (OSError, sqlite3.Error) as e:
+                    print(f"⚠️  Warning: File sample cache is unavailable ({e}).")
             organizer = FileOrganizer(
                 directory=target_directory,
                 recursive=args.recursive,
                 ollama_client=ollama_client,
                 batch_size=self.config['BATCH_SIZE'],
                 text_extensions=self.config['TEXT_EXTENSIONS'],
-                max_content_length=self.config['MAX_CONTENT_LENGTH']
+                max_content_length=self.config['MAX_CONTENT_LENGTH'],
+                prompt_char_budget=self.config['PROMPT_CHAR_BUDGET'],
+                plan_cache=plan_cache,
+                concurrency=max(1, args.concurrency),
+                prompt_content_chars=self.config['PROMPT_CONTENT_CHARS'],
+                binary_extensions=self.config['BINARY_EXTENSIONS'],
+                batch_chars=args.batch_chars,
+                sample_cache=sample_cache,
+                extension_categories=self.config['EXTENSION_CATEGORIES']
             )
-            organizer.organize(args.dry_run, args.yes, args.stream)
+            organizer.organize(args.dry_run, args.yes, args.stream, args.reuse_plan)
         else:
             if args.recursive:
                 print("⚠️  Warning: Recursive mode is only supported for file organization. Running on top-level folders only.")
@@ -541,4 +1675,7 @@ class Broom:
 
 if __name__ == "__main__":
     broom = Broom()
-    broom.run()
\ No newline at end of file
+    try:
+        broom.run()
+    except KeyboardInterrupt:
+        sys.exit("\n⛔ Cancelled by user.")
\ No newline at end of file